@@ -8,6 +8,7 @@ use async_trait::async_trait;
 use bytes::{Bytes, BytesMut};
 use futures::{stream::BoxStream, StreamExt};
 use object_store::aws::AmazonS3Builder;
+use once_cell::sync::OnceCell;
 use serde::{Deserialize, Serialize};
 use tokio::io::AsyncWrite;
 
@@ -65,6 +66,10 @@ pub trait BlobStorageReader {
 #[derive(Clone)]
 pub struct BlobStorage {
     config: BlobStorageConfig,
+    // The configured backends are built on first use and reused, so the S3
+    // client and the disk directories are not set up again for every blob.
+    s3: Arc<OnceCell<s3::S3Storage>>,
+    disk: Arc<OnceCell<disk::DiskStorage>>,
 }
 
 impl Debug for BlobStorage {
@@ -91,34 +96,55 @@ impl std::fmt::Debug for StoragePartWriter {
 
 impl BlobStorage {
     pub fn new_with_config(config: BlobStorageConfig) -> Self {
-        Self { config }
+        Self {
+            config,
+            s3: Arc::new(OnceCell::new()),
+            disk: Arc::new(OnceCell::new()),
+        }
     }
 
-    fn s3_storage(&self, s3: &S3Config) -> Result<s3::S3Storage> {
-        Ok(s3::S3Storage::new(
-            &s3.bucket,
-            AmazonS3Builder::from_env()
-                .with_region(s3.region.as_str())
-                .with_allow_http(true)
-                .with_bucket_name(s3.bucket.clone())
-                .build()
-                .context("unable to build S3 builder")?,
-        ))
+    fn s3_storage(&self) -> Result<&s3::S3Storage> {
+        self.s3.get_or_try_init(|| {
+            let s3 = self
+                .config
+                .s3
+                .as_ref()
+                .ok_or_else(|| anyhow::anyhow!("s3 blob storage is not configured"))?;
+            Ok(s3::S3Storage::new(
+                &s3.bucket,
+                AmazonS3Builder::from_env()
+                    .with_region(s3.region.as_str())
+                    .with_allow_http(true)
+                    .with_bucket_name(s3.bucket.clone())
+                    .build()
+                    .context("unable to build S3 builder")?,
+            ))
+        })
+    }
+
+    // DiskStorage::new creates the "{path}/tmp" staging directory, so it now
+    // runs once per process instead of on every write. If that directory is
+    // removed while the server runs, writes fail until restart.
+    fn disk_storage(&self) -> Result<&disk::DiskStorage> {
+        self.disk.get_or_try_init(|| {
+            // We need a default implementation for `DiskStorageConfig`
+            disk::DiskStorage::new(
+                self.config
+                    .disk
+                    .clone()
+                    .unwrap_or_else(|| DiskStorageConfig {
+                        path: "blobs".to_string(),
+                    }),
+            )
+        })
     }
 
     pub async fn writer(&self, _namespace: &str, key: &str) -> Result<StoragePartWriter> {
-        if let Some(s3) = self.config.s3.as_ref() {
-            self.s3_storage(s3)?.writer(key).await
+        if self.config.s3.is_some() {
+            self.s3_storage()?.writer(key).await
         } else {
             // If it's not S3, assume it's a file
-
-            // We need a default implementation for `DiskStorageConfig`
-            let storage = disk::DiskStorage::new(self.config.disk.clone().unwrap_or_else(|| {
-                DiskStorageConfig {
-                    path: "blobs".to_string(),
-                }
-            }))?;
-            storage.writer(key).await
+            self.disk_storage()?.writer(key).await
         }
     }
 }
@@ -130,22 +156,11 @@ impl BlobStorageWriter for BlobStorage {
         key: &str,
         data: impl futures::Stream<Item = Result<Bytes>> + Send + Unpin,
     ) -> Result<PutResult, anyhow::Error> {
-        if let Some(s3) = self.config.s3.as_ref() {
-            self.s3_storage(s3)?.put(key, data).await
+        if self.config.s3.is_some() {
+            self.s3_storage()?.put(key, data).await
         } else {
             // If it's not S3, assume it's a file
-
-            // We need a default implementation for `DiskStorageConfig`
-            disk::DiskStorage::new(
-                self.config
-                    .disk
-                    .clone()
-                    .unwrap_or_else(|| DiskStorageConfig {
-                        path: "blobs".to_string(),
-                    }),
-            )?
-            .put(key, data)
-            .await
+            self.disk_storage()?.put(key, data).await
         }
     }
 
@@ -172,18 +187,7 @@ impl BlobStorageWriter for BlobStorage {
         }
 
         // If it's not S3, assume it's a file
-
-        // We need a default implementation for `DiskStorageConfig`
-        disk::DiskStorage::new(
-            self.config
-                .disk
-                .clone()
-                .unwrap_or_else(|| DiskStorageConfig {
-                    path: "blobs".to_string(),
-                }),
-        )?
-        .delete(key)
-        .await
+        self.disk_storage()?.delete(key).await
     }
 }
 
@@ -228,7 +232,22 @@ impl ContentReader {
     pub async fn bytes(&self, key: &str) -> Result<Bytes> {
         let reader = self.get(key);
         let mut stream = reader.get(key);
-        let mut bytes = BytesMut::new();
+        // Blobs that arrive as a single chunk are returned without copying, only
+        // multi chunk blobs are assembled into a contiguous buffer.
+        let first = match stream.next().await {
+            Some(chunk) => chunk?,
+            None => return Ok(Bytes::new()),
+        };
+        let mut bytes = match stream.next().await {
+            Some(chunk) => {
+                let chunk = chunk?;
+                let mut bytes = BytesMut::with_capacity(first.len() + chunk.len());
+                bytes.extend_from_slice(&first);
+                bytes.extend_from_slice(&chunk);
+                bytes
+            }
+            None => return Ok(first),
+        };
         while let Some(chunk) = stream.next().await {
             bytes.extend_from_slice(&chunk?);
         }
@@ -242,6 +261,7 @@ mod tests {
 
     use futures::{stream, TryStreamExt};
     use object_store::{aws::AmazonS3, ObjectStore};
+    use tempfile::tempdir;
     use tokio::io::AsyncWriteExt;
 
     use super::*;
@@ -343,4 +363,36 @@ mod tests {
 
         storage.delete("s3://test-bucket/test-key-3").await.unwrap();
     }
+
+    async fn read_disk_content(len: usize) -> Result<()> {
+        let dir = tempdir()?;
+        let path = dir.path().join("content");
+        let data: Vec<u8> = (0..len).map(|i| (i % 251) as u8).collect();
+        std::fs::write(&path, &data)?;
+
+        let reader = ContentReader::new(Arc::new(ServerConfig::default()));
+        let res = reader
+            .bytes(&format!("file://{}", path.to_str().unwrap()))
+            .await?;
+        assert_eq!(res, data);
+
+        dir.close()?;
+        Ok(())
+    }
+
+    #[tokio::test]
+    async fn test_content_reader_bytes_empty() -> Result<()> {
+        read_disk_content(0).await
+    }
+
+    #[tokio::test]
+    async fn test_content_reader_bytes_single_chunk() -> Result<()> {
+        read_disk_content(100).await
+    }
+
+    #[tokio::test]
+    async fn test_content_reader_bytes_multiple_chunks() -> Result<()> {
+        // larger than the chunk size the local file system streams with
+        read_disk_content(100 * 1024).await
+    }
 }
@@ -1,11 +1,4 @@
-use std::{
-    collections::HashMap,
-    fmt,
-    hash::{DefaultHasher, Hash, Hasher},
-    str::FromStr,
-    sync::Arc,
-    time::SystemTime,
-};
+use std::{collections::HashMap, fmt, str::FromStr, sync::Arc, time::SystemTime};
 
 use anyhow::{anyhow, Result};
 use bytes::Bytes;
@@ -15,6 +8,7 @@ use indexify_proto::indexify_coordinator::{self, CreateContentStatus, ListActive
 use itertools::Itertools;
 use mime::Mime;
 use nanoid::nanoid;
+use serde::Deserialize;
 use sha2::{Digest, Sha256};
 use tracing::{error, info};
 
@@ -32,6 +26,9 @@ use crate::{
     vector_index::{ScoredText, VectorIndexManager},
 };
 
+// Upper bound on documents written concurrently by a single add_texts call.
+const MAX_CONCURRENT_TEXT_WRITES: usize = 16;
+
 fn index_in_features(
     output_index_map: &HashMap<String, String>,
     features: &[api::Feature],
@@ -277,37 +274,72 @@ impl DataManager {
         content_list: Vec<api::ContentWithId>,
         extraction_graph_names: Vec<internal_api::ExtractionGraphName>,
     ) -> Result<()> {
-        for content_with_id in content_list {
-            let text = content_with_id.content;
-            let stream = futures::stream::once(async { Ok(Bytes::from(text.bytes)) });
-            let content_metadata = self
-                .write_content_bytes(
-                    namespace,
-                    Box::pin(stream),
-                    text.labels,
-                    text.content_type,
-                    None,
-                    "",
-                    Some(&content_with_id.id),
-                    &extraction_graph_names,
-                )
-                .await?;
+        // Blobs are written concurrently, but every started write runs to
+        // completion so a failure does not abandon blobs half way. Contents are
+        // then created on the coordinator in request order, skipping documents
+        // whose write failed, and the first error is returned.
+        //
+        // A failure therefore no longer stops the batch: every other document
+        // is still written and created, while the caller only sees the error
+        // (the add_texts handler answers 400 without any content ids). Retrying
+        // the whole batch with the same ids writes the created documents' blobs
+        // again, and the coordinator reports those contents as duplicates.
+        let extraction_graph_names = &extraction_graph_names;
+        let written: Vec<Result<indexify_coordinator::ContentMetadata>> =
+            futures::stream::iter(content_list)
+                .map(|content_with_id| async move {
+                    let text = content_with_id.content;
+                    let stream = futures::stream::once(async { Ok(Bytes::from(text.bytes)) });
+                    self.write_content_bytes(
+                        namespace,
+                        Box::pin(stream),
+                        text.labels,
+                        text.content_type,
+                        None,
+                        "",
+                        Some(&content_with_id.id),
+                        extraction_graph_names,
+                    )
+                    .await
+                })
+                .buffered(MAX_CONCURRENT_TEXT_WRITES)
+                .collect()
+                .await;
 
-            let req = indexify_coordinator::CreateContentRequest {
-                content: Some(content_metadata),
+        let mut first_err = None;
+        for content_metadata in written {
+            let res = match content_metadata {
+                Ok(content_metadata) => self.create_text_content(content_metadata).await,
+                Err(e) => Err(e),
             };
-            self.coordinator_client
-                .get()
-                .await?
-                .create_content(GrpcHelper::into_req(req))
-                .await
-                .map_err(|e| {
-                    anyhow!(
-                        "unable to write content metadata to coordinator {}",
-                        e.to_string()
-                    )
-                })?;
+            if let Err(e) = res {
+                first_err.get_or_insert(e);
+            }
+        }
+        match first_err {
+            Some(e) => Err(e),
+            None => Ok(()),
         }
+    }
+
+    async fn create_text_content(
+        &self,
+        content_metadata: indexify_coordinator::ContentMetadata,
+    ) -> Result<()> {
+        let req = indexify_coordinator::CreateContentRequest {
+            content: Some(content_metadata),
+        };
+        self.coordinator_client
+            .get()
+            .await?
+            .create_content(GrpcHelper::into_req(req))
+            .await
+            .map_err(|e| {
+                anyhow!(
+                    "unable to write content metadata to coordinator {}",
+                    e.to_string()
+                )
+            })?;
         Ok(())
     }
 
@@ -403,7 +435,7 @@ impl DataManager {
         let current_ts_secs = SystemTime::now()
             .duration_since(SystemTime::UNIX_EPOCH)?
             .as_secs();
-        let id = id.unwrap_or(nanoid!(16));
+        let id = id.unwrap_or_else(|| nanoid!(16));
         let content_metadata = indexify_coordinator::ContentMetadata {
             id: id.clone(),
             file_name: file.to_string(),
@@ -545,14 +577,14 @@ impl DataManager {
     }
 
     pub fn make_file_name(file_name: Option<&str>) -> String {
-        file_name.map(|f| f.to_string()).unwrap_or(nanoid!())
+        file_name
+            .map(|f| f.to_string())
+            .unwrap_or_else(|| nanoid!())
     }
 
     pub fn make_id() -> String {
-        let mut s = DefaultHasher::new();
-        let id = nanoid!(16);
-        id.hash(&mut s);
-        format!("{:x}", s.finish())
+        // Content ids are hex encoded u64s, a single random draw is enough.
+        format!("{:x}", rand::random::<u64>())
     }
 
     /// Checks if the given string is a valid hexadecimal.
@@ -759,8 +791,10 @@ impl DataManager {
         for feature in &features {
             match feature.feature_type {
                 api::FeatureType::Embedding => {
-                    let embedding_payload: internal_api::Embedding =
-                        serde_json::from_value(feature.data.clone()).map_err(|e| {
+                    // Deserialize from a reference so the embedding values are not
+                    // cloned into an intermediate json value first.
+                    let embedding_payload = internal_api::Embedding::deserialize(&feature.data)
+                        .map_err(|e| {
                             anyhow!("unable to get embedding from extracted data {}", e)
                         })?;
                     self.write_extracted_embedding(
@@ -4,17 +4,7 @@ use anyhow::{anyhow, Result};
 use axum::extract::ws;
 use axum_typed_websockets::{Message, WebSocket};
 use indexify_proto::indexify_coordinator;
-use sha2::{
-    digest::{
-        consts::{B0, B1},
-        core_api::{CoreWrapper, CtVariableCoreWrapper},
-        typenum::{UInt, UTerm},
-    },
-    Digest,
-    OidSha256,
-    Sha256,
-    Sha256VarCore,
-};
+use sha2::{Digest, Sha256};
 use tokio::io::AsyncWriteExt;
 use tracing::info;
 
@@ -45,13 +35,7 @@ struct Writing {
     file_name: String,
     file_size: u64,
     writer: StoragePartWriter,
-    hasher: CoreWrapper<
-        CtVariableCoreWrapper<
-            Sha256VarCore,
-            UInt<UInt<UInt<UInt<UInt<UInt<UTerm, B1>, B0>, B0>, B0>, B0>, B0>,
-            OidSha256,
-        >,
-    >,
+    hasher: Sha256,
 }
 
 #[derive(Debug)]
@@ -64,6 +48,8 @@ struct ContentStateWriting {
     ingest_metadata: BeginExtractedContentIngest,
     task: indexify_coordinator::Task,
     root_content_metadata: Option<indexify_internal_api::ContentMetadata>,
+    // Fetched on first finished content and reused for the rest of the ingest.
+    extraction_policy: Option<ExtractionPolicy>,
     frame_state: FrameState,
 }
 
@@ -81,6 +67,7 @@ impl ContentStateWriting {
             ingest_metadata,
             task,
             root_content_metadata: root_content,
+            extraction_policy: None,
             frame_state: FrameState::New,
         })
     }
@@ -157,17 +144,23 @@ impl ContentStateWriting {
             FrameState::Writing(frame_state) => {
                 frame_state.writer.writer.shutdown().await?;
                 labels.extend(payload.labels);
-                let hash_result = frame_state.hasher.clone().finalize();
+                // Content is hashed incrementally as frames arrive, so finalizing
+                // only has to consume the hasher state.
+                let hash_result = std::mem::take(&mut frame_state.hasher).finalize();
                 let content_hash = format!("{:x}", hash_result);
                 let id = DataManager::make_id();
                 let root_content_metadata = self
                     .root_content_metadata
                     .clone()
-                    .unwrap_or(self.task.content_metadata.clone().unwrap().into());
-                let extraction_policy = state
-                    .data_manager
-                    .get_extraction_policy(&self.task.extraction_policy_id)
-                    .await?;
+                    .unwrap_or_else(|| self.task.content_metadata.clone().unwrap().into());
+                if self.extraction_policy.is_none() {
+                    let extraction_policy = state
+                        .data_manager
+                        .get_extraction_policy(&self.task.extraction_policy_id)
+                        .await?;
+                    self.extraction_policy = Some(extraction_policy);
+                }
+                let extraction_policy = self.extraction_policy.as_ref().unwrap();
                 let content_metadata = indexify_coordinator::ContentMetadata {
                     id: id.clone(),
                     file_name: frame_state.file_name.clone(),
@@ -178,11 +171,11 @@ impl ContentStateWriting {
                     size_bytes: frame_state.file_size,
                     storage_url: frame_state.writer.url.clone(),
                     labels,
-                    source: extraction_policy.name,
+                    source: extraction_policy.name.clone(),
                     created_at: frame_state.created_at,
                     hash: content_hash,
                     extraction_policy_ids: HashMap::new(),
-                    extraction_graph_names: vec![extraction_policy.graph_name],
+                    extraction_graph_names: vec![extraction_policy.graph_name.clone()],
                 };
                 state
                     .data_manager
@@ -711,6 +704,52 @@ mod tests {
         coordinator.stop().await;
     }
 
+    #[tokio::test]
+    async fn test_add_texts() -> Result<()> {
+        set_tracing();
+
+        let state = new_endpoint_state().await?;
+        let coordinator = TestCoordinator::new().await;
+
+        // more documents than are written concurrently
+        let ids: Vec<String> = (0..40).map(|i| format!("{:x}", 0x1000 + i)).collect();
+        let content_list = ids
+            .iter()
+            .map(|id| ContentWithId {
+                id: id.clone(),
+                content: Content {
+                    content_type: "text/plain".to_string(),
+                    bytes: format!("text {}", id).into_bytes(),
+                    features: Vec::new(),
+                    labels: HashMap::new(),
+                },
+                extraction_graph_names: vec!["extraction_graph_name".to_string()],
+            })
+            .collect();
+        state
+            .data_manager
+            .add_texts(
+                DEFAULT_TEST_NAMESPACE,
+                content_list,
+                vec!["extraction_graph_name".to_string()],
+            )
+            .await?;
+
+        let content_list = state
+            .data_manager
+            .get_content_metadata(DEFAULT_TEST_NAMESPACE, ids.clone())
+            .await?;
+        assert_eq!(content_list.len(), ids.len());
+        for content in content_list {
+            assert!(ids.contains(&content.id));
+            let bytes = state.content_reader.bytes(&content.storage_url).await?;
+            assert_eq!(bytes, format!("text {}", content.id).into_bytes());
+        }
+
+        coordinator.stop().await;
+        Ok(())
+    }
+
     #[tokio::test]
     async fn test_embedding_metadata() {
         set_tracing();
@@ -169,10 +169,12 @@ impl Server {
             .allow_headers([CONTENT_TYPE]);
 
         let metrics = HttpMetricsLayerBuilder::new().build();
+        // Build the OpenAPI document once and share it between the doc UIs.
+        let api_doc = ApiDoc::openapi();
         let app = Router::new()
             .merge(metrics.routes())
-            .merge(SwaggerUi::new("/api-docs-ui").url("/api-docs/openapi.json", ApiDoc::openapi()))
-            .merge(Redoc::with_url("/redoc", ApiDoc::openapi()))
+            .merge(SwaggerUi::new("/api-docs-ui").url("/api-docs/openapi.json", api_doc.clone()))
+            .merge(Redoc::with_url("/redoc", api_doc))
             .merge(RapiDoc::new("/api-docs/openapi.json").path("/rapidoc"))
             .route("/", get(root))
             .route(
@@ -622,15 +624,17 @@ async fn add_texts(
         }
     }
 
+    // Consume the documents so the text buffers are reused as content bytes
+    // instead of being copied.
     let content: Vec<api::ContentWithId> = payload
         .documents
-        .iter()
+        .into_iter()
         .map(|d| api::ContentWithId {
-            id: d.id.clone().unwrap_or_else(DataManager::make_id),
+            id: d.id.unwrap_or_else(DataManager::make_id),
             content: api::Content {
                 content_type: mime::TEXT_PLAIN.to_string(),
-                bytes: d.text.as_bytes().to_vec(),
-                labels: d.labels.clone(),
+                bytes: d.text.into_bytes(),
+                labels: d.labels,
                 features: vec![],
             },
             extraction_graph_names: payload.extraction_graph_names.clone(),
@@ -942,26 +946,30 @@ async fn upload_file(
         .map(|s| s.trim().to_string())
         .collect();
 
-    let id = params.id.clone().unwrap_or_else(DataManager::make_id);
-    if !DataManager::is_hex_string(&id) {
-        return Err(IndexifyAPIError::new(
-            StatusCode::BAD_REQUEST,
-            "Invalid ID format, ID must be a hex string",
-        ));
-    }
+    // Only ids supplied by the caller need validating, generated ids are always
+    // well formed hex strings, as in add_texts.
+    if let Some(id) = &params.id {
+        if !DataManager::is_hex_string(id) {
+            return Err(IndexifyAPIError::new(
+                StatusCode::BAD_REQUEST,
+                "Invalid ID format, ID must be a hex string",
+            ));
+        }
 
-    //  check if the id already exists for content metadata
-    let retrieved_content = state
-        .data_manager
-        .get_content_metadata(&namespace, vec![id.clone()])
-        .await
-        .map_err(IndexifyAPIError::internal_error)?;
-    if !retrieved_content.is_empty() {
-        return Err(IndexifyAPIError::new(
-            StatusCode::BAD_REQUEST,
-            "content with the provided id already exists",
-        ));
+        //  check if the id already exists for content metadata
+        let retrieved_content = state
+            .data_manager
+            .get_content_metadata(&namespace, vec![id.clone()])
+            .await
+            .map_err(IndexifyAPIError::internal_error)?;
+        if !retrieved_content.is_empty() {
+            return Err(IndexifyAPIError::new(
+                StatusCode::BAD_REQUEST,
+                "content with the provided id already exists",
+            ));
+        }
     }
+    let id = params.id.clone().unwrap_or_else(DataManager::make_id);
 
     while let Some(field) = files.next_field().await.unwrap() {
         if let Some(name) = field.file_name() {
@@ -204,8 +204,7 @@ impl VectorIndexManager {
             .pop()
             .ok_or(anyhow!("No embeddings were extracted"))?;
 
-        let embedding =
-            serde_json::from_value(feature.data.clone()).map_err(|e| anyhow!(e.to_string()))?;
+        let embedding = serde_json::from_value(feature.data).map_err(|e| anyhow!(e.to_string()))?;
 
         Ok(embedding)
     }
@@ -1,8 +1,12 @@
-use std::collections::HashMap;
+use std::{
+    collections::HashMap,
+    fmt::{self, Debug, Formatter},
+};
 
 use anyhow::{anyhow, Result};
 use async_trait::async_trait;
 use indexify_internal_api::ContentMetadata;
+use once_cell::sync::OnceCell;
 use qdrant_client::{
     client::{QdrantClient, QdrantClientConfig},
     qdrant::{
@@ -42,36 +46,49 @@ fn u64_to_hex(number: u64) -> String {
     format!("{:x}", number)
 }
 
-#[derive(Debug)]
 pub struct QdrantDb {
     qdrant_config: QdrantConfig,
+    // The client owns the gRPC channel to qdrant. It is created on first use
+    // and shared by every call so that requests reuse the same connection.
+    client: OnceCell<QdrantClient>,
 }
+
+impl Debug for QdrantDb {
+    fn fmt(&self, f: &mut Formatter<'_>) -> fmt::Result {
+        f.debug_struct("QdrantDb")
+            .field("qdrant_config", &self.qdrant_config)
+            .finish()
+    }
+}
+
 fn extract_metadata_from_payload(
     payload: HashMap<String, qdrant_client::qdrant::Value>,
 ) -> Result<(HashMap<String, serde_json::Value>, IndexifyPayload)> {
     let payload: serde_json::Value =
         serde_json::to_value(payload).map_err(|e| anyhow!("{}", e.to_string()))?;
     let mut payload: HashMap<String, serde_json::Value> =
-        serde_json::from_value(payload.clone()).map_err(|e| anyhow!(e.to_string()))?;
+        serde_json::from_value(payload).map_err(|e| anyhow!(e.to_string()))?;
     let indexify_payload = payload
         .remove("indexify_payload")
         .ok_or(anyhow!("no indexify system payload found"))?;
     let indexify_payload: IndexifyPayload =
-        serde_json::from_value(indexify_payload.clone()).map_err(|e| anyhow!(e))?;
+        serde_json::from_value(indexify_payload).map_err(|e| anyhow!(e))?;
     Ok((payload, indexify_payload))
 }
 impl QdrantDb {
     pub fn new(config: QdrantConfig) -> QdrantDb {
         Self {
             qdrant_config: config,
+            client: OnceCell::new(),
         }
     }
 
-    fn create_client(&self) -> Result<QdrantClient> {
-        let client_config = QdrantClientConfig::from_url(&self.qdrant_config.addr);
-        let client = QdrantClient::new(Some(client_config))
-            .map_err(|e| anyhow!("unable to create a new quadrant index: {}", e))?;
-        Ok(client)
+    fn client(&self) -> Result<&QdrantClient> {
+        self.client.get_or_try_init(|| {
+            let client_config = QdrantClientConfig::from_url(&self.qdrant_config.addr);
+            QdrantClient::new(Some(client_config))
+                .map_err(|e| anyhow!("unable to create a new quadrant index: {}", e))
+        })
     }
 
     fn convert_to_qdrant_distance(distance: IndexDistance) -> Distance {
@@ -121,7 +138,7 @@ impl VectorDb for QdrantDb {
     #[tracing::instrument]
     async fn create_index(&self, index: CreateIndexParams) -> Result<()> {
         let result = self
-            .create_client()?
+            .client()?
             .create_collection(&CreateCollection {
                 collection_name: index.vectordb_index_name,
                 vectors_config: Some(VectorsConfig {
@@ -174,7 +191,7 @@ impl VectorDb for QdrantDb {
             ));
         }
         let _result = self
-            .create_client()?
+            .client()?
             .upsert_points(&index, None, points, None)
             .await
             .map_err(|e| anyhow!("unable to add embedding: {}", e.to_string()))?;
@@ -189,7 +206,7 @@ impl VectorDb for QdrantDb {
                 point_id_options: Some(Num(point_id)),
             });
         }
-        let client = self.create_client()?;
+        let client = self.client()?;
 
         let result = client
             .get_points(&index, None, &points, Some(true), Some(true), None)
@@ -227,7 +244,7 @@ impl VectorDb for QdrantDb {
         let point_id = hex_to_u64(&content_id).unwrap();
         let points: Vec<PointId> = vec![point_id.into()];
         let _result = self
-            .create_client()?
+            .client()?
             .set_payload(&index, None, &points.into(), metadata, None, None)
             .await
             .map_err(|e| anyhow!("unable to update metadata: {}", e.to_string()))?;
@@ -241,7 +258,7 @@ impl VectorDb for QdrantDb {
                 ids: vec![hex_to_u64(content_id).unwrap().into()],
             })),
         };
-        self.create_client()?
+        self.client()?
             .delete_points_blocking(index, None, &points_selector, None)
             .await
             .map_err(|e| {
@@ -281,7 +298,7 @@ impl VectorDb for QdrantDb {
             });
         }
         let result = self
-            .create_client()?
+            .client()?
             .search_points(&SearchPoints {
                 collection_name: index,
                 vector: query_embedding,
@@ -311,7 +328,7 @@ impl VectorDb for QdrantDb {
 
     #[tracing::instrument]
     async fn drop_index(&self, index: &str) -> Result<()> {
-        let result = self.create_client()?.delete_collection(index).await;
+        let result = self.client()?.delete_collection(index).await;
         if let Err(err) = result {
             if err.to_string().contains("doesn't exist") {
                 return Ok(());
@@ -328,7 +345,7 @@ impl VectorDb for QdrantDb {
     #[tracing::instrument]
     async fn num_vectors(&self, index: &str) -> Result<u64> {
         let result = self
-            .create_client()?
+            .client()?
             .collection_info(index)
             .await
             .map_err(|e| anyhow!(e.to_string()))?;